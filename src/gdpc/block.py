@@ -5,6 +5,7 @@ from typing import Any, Union, Optional, Dict, Sequence
 from dataclasses import dataclass, field
 from copy import copy, deepcopy
 import random
+import sys
 
 from glm import bvec3
 from nbt import nbt
@@ -90,7 +91,8 @@ class Block:
     def fromBlockStateTag(blockStateTag: nbt.TAG_Compound, blockEntityTag: Optional[nbt.TAG_Compound] = None):
         """Parses a block state compound tag (as found in chunk palettes) into a Block.\n
         If <blockEntityTag> is provided, it is parsed into the Block's .data attribute."""
-        block = Block(str(blockStateTag["Name"]))
+        # Interning the id makes lookups in the (interned) id sets of the lookup module cheaper.
+        block = Block(sys.intern(str(blockStateTag["Name"])))
 
         if "Properties" in blockStateTag:
             for tag in blockStateTag["Properties"].tags:
@@ -7,6 +7,7 @@ It is recommended to use the higher-level `editor.Editor` class instead.
 from typing import Sequence, Tuple, Optional, List, Dict, Any, Union
 from functools import partial
 import time
+import sys
 from urllib.parse import urlparse
 import logging
 import json
@@ -84,7 +85,8 @@ def getBlocks(position: Vec3iLike, size: Optional[Vec3iLike] = None, dimension:
     }
     response = _request("GET", url, params=parameters, retries=retries, timeout=timeout)
     blockDicts: List[Dict[str, Any]] = response.json()
-    return [(ivec3(b["x"], b["y"], b["z"]), Block(b["id"], b.get("state", {}), b.get("data") if b.get("data") != "{}" else None)) for b in blockDicts]
+    # Block ids are interned, like the ones in the lookup module, to make lookups with them cheaper.
+    return [(ivec3(b["x"], b["y"], b["z"]), Block(sys.intern(b["id"]), b.get("state", {}), b.get("data") if b.get("data") != "{}" else None)) for b in blockDicts]
 
 
 def getBiomes(position: Vec3iLike, size: Optional[Vec3iLike] = None, dimension: Optional[str] = None, retries=0, timeout=None, host=DEFAULT_HOST):
@@ -1,11 +1,11 @@
 """Provides various Minecraft-related utility functions."""
 
 
-from typing import Any, Optional, Union, List
+from typing import Any, Optional, Tuple, Union, List
 from functools import lru_cache
 import json
 
-from .vector_tools import Vec2iLike, Rect
+from .vector_tools import Vec2iLike
 from . import lookup
 from .block import Block
 
@@ -15,6 +15,13 @@ from .block import Block
 # ==================================================================================================
 
 
+@lru_cache(maxsize=512)
+def _textJson(text: str):
+    """Returns a JSON text component containing <text>"""
+    return '{"text": ' + json.dumps(text) + '}'
+
+
+@lru_cache(maxsize=256)
 def signData(
     frontLine1: str = "",
     frontLine2: str = "",
@@ -33,8 +40,10 @@ def signData(
     """Returns an SNBT string with sign data"""
 
     def sideCompound(line1: str, line2: str, line3: str, line4: str, color: str, isGlowing: bool):
-        fields: List[str] = []
-        fields.append(f'messages: [{",".join(repr(json.dumps({"text": line})) for line in [line1, line2, line3, line4])}]')
+        messages = f'messages: [{",".join(repr(_textJson(line)) for line in [line1, line2, line3, line4])}]'
+        if not color and not isGlowing:
+            return "{" + messages + "}"
+        fields: List[str] = [messages]
         if color:
             fields.append(f'Color: {repr(color)}')
         if isGlowing:
@@ -59,6 +68,22 @@ def lecternData(bookData: Optional[str], page: int = 0):
     return f'{{Book: {{id: "minecraft:written_book", Count: 1b, tag: {bookData}, Page: {page}}}}}'
 
 
+@lru_cache(maxsize=4096)
+def _fontWidth(word: str):
+    """Return the length of a word based on character width.
+
+    If a letter is not found, a width of 9 is assumed
+    A character spacing of 1 is automatically integrated
+    """
+    widths = lookup.ASCII_CHAR_WIDTHS
+    try:
+        # Fast path: map each byte to its width in one pass.
+        return sum(word.encode("latin-1").translate(widths)) + len(word) - 1
+    except UnicodeEncodeError:
+        return sum(widths[ord(letter)] if letter < "\u0100" else 9 for letter in word) + len(word) - 1
+
+
+@lru_cache(maxsize=128)
 def bookData(
     text: str,
     title       = "Chronicle",
@@ -107,30 +132,22 @@ def bookData(
     characters_left = lookup.BOOK_CHARACTERS_PER_PAGE
     lines_left      = lookup.BOOK_LINES_PER_PAGE
     pixels_left     = lookup.BOOK_PIXELS_PER_LINE
-    toprint = ''
-
-    @lru_cache()
-    def fontwidth(word):
-        """Return the length of a word based on character width.
+    toprint: List[str] = []
 
-        If a letter is not found, a width of 9 is assumed
-        A character spacing of 1 is automatically integrated
-        """
-        return sum(lookup.ASCII_CHAR_TO_WIDTH.get(letter, 9) + 1 for letter in word) - 1
-
-    SPACE_WIDTH = fontwidth(' ')
+    SPACE_WIDTH = _fontWidth(' ')
 
     def printline():
         nonlocal outputPages, toprint
-        formatting = toprint[:2]
+        line = "".join(toprint)
+        formatting = line[:2]
         spaces_left = pixels_left // 4 + 3
         if formatting == '\\c':      # centered text
-            outputPages[-1] += spaces_left // 2 * ' ' + toprint[2:-1] + spaces_left // 2 * ' '
+            outputPages[-1].append(spaces_left // 2 * ' ' + line[2:-1] + spaces_left // 2 * ' ')
         elif formatting == '\\r':    # right-aligned text
-            outputPages[-1] += spaces_left * ' ' + toprint[2:-1]
+            outputPages[-1].append(spaces_left * ' ' + line[2:-1])
         else:
-            outputPages[-1] += toprint
-        toprint = ''
+            outputPages[-1].append(line)
+        toprint = []
 
     def newline():
         nonlocal characters_left, lines_left, pixels_left, outputPages
@@ -141,7 +158,7 @@ def bookData(
         characters_left -= 2
         lines_left -= 1
         pixels_left = lookup.BOOK_PIXELS_PER_LINE
-        outputPages[-1] += "\n"
+        outputPages[-1].append("\n")
 
     def newpage():
         nonlocal characters_left, lines_left, pixels_left, outputPages
@@ -149,62 +166,67 @@ def bookData(
         characters_left = lookup.BOOK_CHARACTERS_PER_PAGE
         lines_left      = lookup.BOOK_LINES_PER_PAGE
         pixels_left     = lookup.BOOK_PIXELS_PER_LINE
-        outputPages.append("") # end page and start new page
+        outputPages.append([]) # end page and start new page
 
     pages = list(text.split('\f'))
 
-    outputPages: List[str] = [""] # start first page
+    outputPages: List[List[str]] = [[]] # start first page
 
     for page in pages:
         if pages_left < 1:
             break
         if page[:3] == '\\\\s':
-            outputPages[-1] += page[3:]
+            outputPages[-1].append(page[3:])
             newpage()
             continue
         else:
-            page = [[word for word in line.split()] for line in page.split('\n')]
-        for line in page:
-            toprint = ""
-            for word in line:
-                if pixels_left != lookup.BOOK_PIXELS_PER_LINE:
-                    if characters_left < 1:
-                        newpage()
-                    elif SPACE_WIDTH > pixels_left:
-                        newline()
-                    else:
-                        toprint += ' '
-                        characters_left -= 1
-                        pixels_left -= SPACE_WIDTH
-
-                width = fontwidth(word)
-                if width > pixels_left:
-                    if width > lookup.BOOK_PIXELS_PER_LINE:  # cut word to fit
-                        original = word
-                        for letter in original:
-                            charwidth = fontwidth(letter) + 1
-                            if charwidth > pixels_left:
-                                newline()
-                            toprint += letter
-                            width -= charwidth
-                            word = word[1:]
-                            characters_left -= 1
-                            pixels_left -= charwidth
-                            if not width > pixels_left:
-                                break
-                    else:
-                        newline()
-                if len(word) > characters_left:
+            # words with their widths, with None marking the end of each line
+            tokens: List[Optional[Tuple[str, int]]] = []
+            for line in page.split('\n'):
+                tokens.extend((word, _fontWidth(word)) for word in line.split())
+                tokens.append(None)
+        for token in tokens:
+            if token is None:
+                newline()       # finish line
+                continue
+            word, width = token
+            if pixels_left != lookup.BOOK_PIXELS_PER_LINE:
+                if characters_left < 1:
                     newpage()
-                toprint += word
-                characters_left -= len(word)
-                pixels_left -= width
-            newline()           # finish line
+                elif SPACE_WIDTH > pixels_left:
+                    newline()
+                else:
+                    toprint.append(' ')
+                    characters_left -= 1
+                    pixels_left -= SPACE_WIDTH
+
+            if width > pixels_left:
+                if width > lookup.BOOK_PIXELS_PER_LINE:  # cut word to fit
+                    charwidths = [_fontWidth(letter) + 1 for letter in word]
+                    cut = 0
+                    for letter, charwidth in zip(word, charwidths):
+                        if charwidth > pixels_left:
+                            newline()
+                        toprint.append(letter)
+                        width -= charwidth
+                        cut += 1
+                        characters_left -= 1
+                        pixels_left -= charwidth
+                        if not width > pixels_left:
+                            break
+                    word = word[cut:]
+                else:
+                    newline()
+            if len(word) > characters_left:
+                newpage()
+            toprint.append(word)
+            characters_left -= len(word)
+            pixels_left -= width
         newpage()               # finish page
     del outputPages[-1] # end last page (book is complete)
 
     loreJSON = json.dumps([{"text": description, "color": desccolor}])
-    pageJSON = [json.dumps({"text": p}) for p in outputPages]
+    pageJSON = ['{"text": ' + json.dumps("".join(p)) + '}' for p in outputPages]
     return (
         "{"
         f'title: {repr(title)}, author: {repr(author)}, '
@@ -255,9 +277,21 @@ def lecternBlock(facing: str = "north", bookData: Optional[str] = None, page: in
 
 def positionToInventoryIndex(position: Vec2iLike, inventorySize: Vec2iLike):
     """Returns the flat index of the slot at <position> in an inventory of size <inventorySize>."""
-    if not Rect(size=inventorySize).contains(position):
+    x, y = position[0], position[1]
+    if not (0 <= x < inventorySize[0] and 0 <= y < inventorySize[1]):
         raise ValueError(f"{position} is not between (0, 0) and {tuple(inventorySize)}!")
-    return position[0] + position[1] * inventorySize[0]
+    return x + y * inventorySize[0]
+
+
+# The obtrusiveness of each non-opaque block. The categories are applied from least to most
+# transparent, so that a block in several of them gets the weight of the most transparent one.
+_OBTRUSIVENESS = {
+    blockId: weight
+    for weight, category in (
+        (3, lookup.OBTRUSIVE), (2, lookup.UNOBTRUSIVE), (1, lookup.FILTERING), (0, lookup.INVISIBLE)
+    )
+    for blockId in category
+}
 
 
 def getObtrusiveness(block: Block):
@@ -265,12 +299,4 @@ def getObtrusiveness(block: Block):
     Returns a numeric weight from 0 (invisible) to 4 (opaque)."""
     if not block.id:
         return 0
-    if block.id in lookup.INVISIBLE:
-        return 0
-    if block.id in lookup.FILTERING:
-        return 1
-    if block.id in lookup.UNOBTRUSIVE:
-        return 2
-    if block.id in lookup.OBTRUSIVE:
-        return 3
-    return 4
+    return _OBTRUSIVENESS.get(block.id, 4)
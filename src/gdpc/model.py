@@ -5,7 +5,7 @@ from typing import Union, Optional, List, Dict
 from copy import copy
 from glm import ivec3
 
-from .vector_tools import Vec3iLike, Box
+from .vector_tools import Vec3iLike
 from .transform import TransformLike
 from .editor import Editor
 from .block import Block
@@ -18,16 +18,28 @@ class Model:
     transformations.
     """
 
-    def __init__(self, size: Vec3iLike, blocks: Optional[List[Optional[Block]]] = None):
-        """Constructs a Model of size [size], optionally filled with [blocks]."""
+    def __init__(self, size: Vec3iLike, blocks: Optional[List[Optional[Block]]] = None, sparse: bool = False):
+        """Constructs a Model of size [size], optionally filled with [blocks].
+
+        If [sparse] is True, only the non-empty positions are stored, which saves memory for
+        large models that are mostly empty."""
         self._size = ivec3(*size)
-        volume = self._size.x * self._size.y * self._size.z
-        if blocks is not None:
-            if len(blocks) != volume:
-                raise ValueError("The number of blocks should be equal to size[0] * size[1] * size[2]")
+        # Strides of the flat block list, as plain ints
+        self._sizeZ  = self._size.z
+        self._sizeYZ = self._size.y * self._sizeZ
+        self._volume = self._size.x * self._sizeYZ
+        self._sparse = sparse
+        self._blocks: Union[List[Optional[Block]], Dict[int, Block]]
+        if blocks is not None and len(blocks) != self._volume:
+            raise ValueError("The number of blocks should be equal to size[0] * size[1] * size[2]")
+        if sparse:
+            self._blocks = {} if blocks is None else {
+                index: block for index, block in enumerate(blocks) if block is not None
+            }
+        elif blocks is not None:
             self._blocks = copy(blocks)
         else:
-            self._blocks = [None] * volume
+            self._blocks = [None] * self._volume
 
 
     @property
@@ -35,19 +47,53 @@ class Model:
         """This Model's size"""
         return copy(self._size)
 
+    @property
+    def sparse(self):
+        """Whether this Model only stores its non-empty positions"""
+        return self._sparse
+
     @property
     def blocks(self) -> List[Optional[Block]]:
         """This Model's block list"""
+        if self._sparse:
+            return [self._blocks.get(index) for index in range(self._volume)]
         return copy(self._blocks) # Allows block modification, but not resizing
 
 
+    def _checkSparseIndex(self, index: int):
+        """Returns [index] normalized like a list index of the block list would be, or raises an
+        IndexError if it is out of range"""
+        if index < 0:
+            index += self._volume
+        if not 0 <= index < self._volume:
+            raise IndexError("Model index out of range")
+        return index
+
+
     def getBlock(self, position: Vec3iLike):
         """Returns the block at [vec]"""
-        return self._blocks[(position[0] * self._size.y + position[1]) * self._size.z + position[2]]
+        index = position[0] * self._sizeYZ + position[1] * self._sizeZ + position[2]
+        if self._sparse:
+            return self._blocks.get(self._checkSparseIndex(index))
+        return self._blocks[index]
+
+    def getBlockFlat(self, index: int):
+        """Returns the block at flat [index] of this Model's block list.
+
+        The block at (x, y, z) is at index (x * size.y + y) * size.z + z."""
+        if self._sparse:
+            return self._blocks.get(self._checkSparseIndex(index))
+        return self._blocks[index]
 
     def setBlock(self, position: Vec3iLike, block: Optional[Block]):
         """Sets the block at [vec] to [block]"""
-        self._blocks[(position[0] * self._size.y + position[1]) * self._size.z + position[2]] = block
+        index = position[0] * self._sizeYZ + position[1] * self._sizeZ + position[2]
+        if not self._sparse:
+            self._blocks[index] = block
+        elif block is None:
+            self._blocks.pop(self._checkSparseIndex(index), None)
+        else:
+            self._blocks[self._checkSparseIndex(index)] = block
 
 
     def build(
@@ -64,12 +110,18 @@ class Model:
         if substitutions is None: substitutions = {}
 
         with editor.pushTransform(transformLike):
-            for vec in Box(size=self._size).inner:
-                block = self.getBlock(vec)
+            if self._sparse:
+                blocks = sorted(self._blocks.items())
+            else:
+                blocks = enumerate(self._blocks)
+            for index, block in blocks:
                 if block is not None:
+                    x, yz = divmod(index, self._sizeYZ)
+                    y, z  = divmod(yz, self._sizeZ)
                     blockToPlace = copy(block)
                     blockToPlace.id = substitutions.get(block.id, block.id)
-                    editor.placeBlock(vec, blockToPlace, replace)
+                    editor.placeBlock(ivec3(x, y, z), blockToPlace, replace)
 
     def __repr__(self):
-        return f"Model(size={repr(self.size)}, blocks={repr(self.blocks)})"
+        sparse = ", sparse=True" if self._sparse else ""
+        return f"Model(size={repr(self.size)}, blocks={repr(self.blocks)}{sparse})"
@@ -1,36 +1,74 @@
 """Utilities for working with Minecraft's NBT and SNBT formats"""
-from typing import Union
+from typing import Callable, Dict, List, Union
 from pathlib import Path
 from nbt import nbt
 
 
+# Converters for the tags that contain no other tags, keyed by exact type.
+_LEAF_TAG_TO_SNBT: Dict[type, Callable[[nbt.TAG], str]] = {
+    nbt.TAG_Byte_Array: lambda tag: f"[B;{','.join([f'{b}b' for b in tag.value])}]",
+    nbt.TAG_Int_Array:  lambda tag: f"[I;{','.join([f'{i}' for i in tag.value])}]",
+    nbt.TAG_Long_Array: lambda tag: f"[L;{','.join([f'{l}l' for l in tag.value])}]",
+    nbt.TAG_Byte:       lambda tag: f"{tag.value}b",
+    nbt.TAG_Short:      lambda tag: f"{tag.value}s",
+    nbt.TAG_Int:        lambda tag: f"{tag.value}",
+    nbt.TAG_Long:       lambda tag: f"{tag.value}l",
+    nbt.TAG_Float:      lambda tag: f"{tag.value}f",
+    nbt.TAG_Double:     lambda tag: f"{tag.value}d",
+    nbt.TAG_String:     lambda tag: repr(tag.value),
+}
+
+
+class _SnbtLiteral(str):
+    """Marks a piece of SNBT output on the stack of nbtToSnbt(), to tell it apart from str input"""
+
+
+_LIST_END     = _SnbtLiteral("]")
+_COMPOUND_END = _SnbtLiteral("}")
+_SEPARATOR    = _SnbtLiteral(",")
+
+
 def nbtToSnbt(tag: nbt.TAG) -> str:
-    """Recursively converts an NBT tag to an SNBT string"""
-    if isinstance(tag, nbt.TAG_List):
-        return f"[{','.join(nbtToSnbt(t) for t in tag)}]"
-    if isinstance(tag, nbt.TAG_Compound):
-        return f"{{{','.join(f'{k}:{nbtToSnbt(v)}' for k, v in tag.items())}}}"
-    if isinstance(tag, nbt.TAG_Byte_Array):
-        return f"[B;{','.join(f'{b}b' for b in tag.value)}]"
-    if isinstance(tag, nbt.TAG_Int_Array):
-        return f"[I;{','.join(f'{i}' for i in tag.value)}]"
-    if isinstance(tag, nbt.TAG_Long_Array):
-        return f"[L;{','.join(f'{l}l' for l in tag.value)}]"
-    if isinstance(tag, nbt.TAG_Byte):
-        return f"{tag.value}b"
-    if isinstance(tag, nbt.TAG_Short):
-        return f"{tag.value}s"
-    if isinstance(tag, nbt.TAG_Int):
-        return f"{tag.value}"
-    if isinstance(tag, nbt.TAG_Long):
-        return f"{tag.value}l"
-    if isinstance(tag, nbt.TAG_Float):
-        return f"{tag.value}f"
-    if isinstance(tag, nbt.TAG_Double):
-        return f"{tag.value}d"
-    if isinstance(tag, nbt.TAG_String):
-        return repr(tag.value)
-    raise TypeError(f"Unrecognized tag type: {type(tag)}")
+    """Converts an NBT tag to an SNBT string"""
+    # The tree is walked with an explicit stack rather than recursively, since NBT can be nested
+    # deeper than Python's recursion limit allows. The stack holds tags that still need to be
+    # converted and literal pieces of output that still need to be emitted, in reverse order.
+    parts: List[str] = []
+    stack: List[Union[nbt.TAG, _SnbtLiteral]] = [tag]
+    while stack:
+        item = stack.pop()
+        leafToSnbt = _LEAF_TAG_TO_SNBT.get(type(item))
+        if leafToSnbt is not None:
+            parts.append(leafToSnbt(item))
+        elif type(item) is _SnbtLiteral:
+            parts.append(item)
+        elif isinstance(item, nbt.TAG_List):
+            parts.append("[")
+            stack.append(_LIST_END)
+            children = item.tags
+            for i in range(len(children) - 1, -1, -1):
+                stack.append(children[i])
+                if i:
+                    stack.append(_SEPARATOR)
+        elif isinstance(item, nbt.TAG_Compound):
+            parts.append("{")
+            stack.append(_COMPOUND_END)
+            entries = list(item.items())
+            for i in range(len(entries) - 1, -1, -1):
+                name, child = entries[i]
+                stack.append(child)
+                stack.append(_SnbtLiteral(f"{name}:"))
+                if i:
+                    stack.append(_SEPARATOR)
+        else:
+            # Subclasses of the leaf tag types
+            for tagType, leafToSnbt in _LEAF_TAG_TO_SNBT.items():
+                if isinstance(item, tagType):
+                    parts.append(leafToSnbt(item))
+                    break
+            else:
+                raise TypeError(f"Unrecognized tag type: {type(item)}")
+    return "".join(parts)
 
 
 def parseNbtFile(
@@ -39,8 +77,9 @@ def parseNbtFile(
     """Create NBT object from stored NBT file."""
     if isinstance(filePath, str):
         filePath = Path(filePath)
-    fileObject = open(filePath, 'rb')
-    return nbt.NBTFile(fileobj=fileObject)
+    # NBTFile parses the whole file in its constructor, so the file can be closed right away.
+    with open(filePath, 'rb') as file:
+        return nbt.NBTFile(fileobj=file)
 
 
 def saveNbtFile(
@@ -54,7 +93,6 @@ def saveNbtFile(
     with open(filePath, 'wb') as file:
         if isinstance(data, bytes):
             file.write(data)
-            file.close()
         elif isinstance(data, nbt.NBTFile):
             data.write_file(fileobj=file)
         print(f"File saved to: {filePath}")
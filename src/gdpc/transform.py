@@ -1,14 +1,61 @@
 """Provides the Transform class and related functions"""
 
 
-from typing import Union
+from typing import Dict, Tuple, Union
 from dataclasses import dataclass
 
-from glm import ivec3, bvec3
+from glm import ivec3, bvec3, imat3x3, transpose
 
 from .vector_tools import Vec3iLike, Vec3bLike, rotate3D, flipRotation3D, flipToScale3D, rotateSize3D, Box
 
 
+# ==================================================================================================
+# Rotation/flip tables
+# ==================================================================================================
+
+
+# There are only 4 * 8 combinations of rotation and flip, so the matrices that apply them (flip
+# first) and the flipped rotations are precomputed.
+_ROTATION_FLIP_MATRICES:         Dict[Tuple[int, bvec3], imat3x3] = {}
+_INVERSE_ROTATION_FLIP_MATRICES: Dict[Tuple[int, bvec3], imat3x3] = {}
+_FLIPPED_ROTATIONS:              Dict[Tuple[int, bvec3], int]     = {}
+for _rotation in range(4):
+    for _flipBits in range(8):
+        _flip = bvec3(_flipBits & 1, _flipBits & 2, _flipBits & 4)
+        _matrix = imat3x3(*(
+            rotate3D(axis * flipToScale3D(_flip), _rotation)
+            for axis in (ivec3(1, 0, 0), ivec3(0, 1, 0), ivec3(0, 0, 1))
+        ))
+        _ROTATION_FLIP_MATRICES        [(_rotation, _flip)] = _matrix
+        _INVERSE_ROTATION_FLIP_MATRICES[(_rotation, _flip)] = transpose(_matrix)
+        _FLIPPED_ROTATIONS             [(_rotation, _flip)] = flipRotation3D(_rotation, _flip)
+del _rotation, _flipBits, _flip, _matrix
+
+_NO_FLIP = bvec3()
+
+
+def _rotationFlipMatrix(rotation: int, flip: bvec3) -> imat3x3:
+    """Returns the matrix that applies [flip] and then [rotation]"""
+    matrix = _ROTATION_FLIP_MATRICES.get((rotation, flip))
+    if matrix is None:
+        raise ValueError("Rotation must be in {0,1,2,3}")
+    return matrix
+
+
+def _inverseRotationFlipMatrix(rotation: int, flip: bvec3) -> imat3x3:
+    """Returns the inverse of _rotationFlipMatrix([rotation], [flip])"""
+    matrix = _INVERSE_ROTATION_FLIP_MATRICES.get((rotation, flip))
+    if matrix is None:
+        raise ValueError("Rotation must be in {0,1,2,3}")
+    return matrix
+
+
+def _flipRotation(rotation: int, flip: bvec3) -> int:
+    """Cached version of vector_tools.flipRotation3D()"""
+    flipped = _FLIPPED_ROTATIONS.get((rotation, flip))
+    return flipRotation3D(rotation, flip) if flipped is None else flipped
+
+
 # ==================================================================================================
 # Transform class
 # ==================================================================================================
@@ -71,19 +118,23 @@ class Transform:
     def apply(self, vec: Vec3iLike):
         """Applies this transform to [vec].\n
         Equivalent to [self] * [vec]. """
-        return rotate3D(ivec3(*vec) * flipToScale3D(self._flip), self._rotation) + self._translation
+        if self._rotation == 0 and self._flip == _NO_FLIP:
+            return ivec3(*vec) + self._translation
+        return _rotationFlipMatrix(self._rotation, self._flip) * ivec3(*vec) + self._translation
 
     def invApply(self, vec: Vec3iLike):
         """Applies the inverse of this transform to [vec].\n
         Faster version of ~[self] * [vec]."""
-        return rotate3D(ivec3(*vec) - self._translation, (-self._rotation + 4) % 4) * flipToScale3D(self._flip)
+        return _inverseRotationFlipMatrix(self._rotation, self._flip) * (ivec3(*vec) - self._translation)
 
     def compose(self, other: 'Transform'):
         """Returns a transform that applies [self] after [other].\n
         Equivalent to [self] @ [other]. """
+        if self._rotation == 0 and self._flip == _NO_FLIP:
+            return Transform(self._translation + other._translation, other._rotation & 3, other._flip)
         return Transform(
             translation = self.apply(other._translation),
-            rotation    = (self._rotation + flipRotation3D(other._rotation, self._flip)) % 4,
+            rotation    = (self._rotation + _flipRotation(other._rotation, self._flip)) & 3,
             flip        = self._flip ^ other._flip
         )
 
@@ -92,7 +143,7 @@ class Transform:
         Faster version of ~[self] @ [other]."""
         return Transform(
             translation = self.invApply(other._translation),
-            rotation    = flipRotation3D((other._rotation - self._rotation + 4) % 4, self._flip),
+            rotation    = _flipRotation((other._rotation - self._rotation) & 3, self._flip),
             flip        = self._flip ^ other._flip
         )
 
@@ -100,9 +151,9 @@ class Transform:
         """Returns a transform that applies [self] after [other]^-1.\n
         Faster version of [self] @ ~[other]."""
         flip = self._flip ^ other._flip
-        rotation = (self._rotation - flipRotation3D(other._rotation, flip) + 4) % 4
+        rotation = (self._rotation - _flipRotation(other._rotation, flip)) & 3
         return Transform(
-            translation = self._translation - rotate3D(other._translation * flipToScale3D(flip), rotation),
+            translation = self._translation - _rotationFlipMatrix(rotation, flip) * other._translation,
             rotation    = rotation,
             flip        = flip
         )
@@ -110,23 +161,28 @@ class Transform:
     def push(self, other: 'Transform'):
         """Adds the effect of [other] to this transform.\n
         Equivalent to [self] @= [other]."""
-        self._translation += rotate3D(other._translation * flipToScale3D(self._flip), self._rotation)
-        self._rotation     = (self._rotation + flipRotation3D(other._rotation, self._flip)) % 4
+        if self._rotation == 0 and self._flip == _NO_FLIP:
+            self._translation += other._translation
+            self._rotation     = other._rotation & 3
+            self._flip         = bvec3(other._flip)
+            return
+        self._translation += _rotationFlipMatrix(self._rotation, self._flip) * other._translation
+        self._rotation     = (self._rotation + _flipRotation(other._rotation, self._flip)) & 3
         self._flip         = self._flip ^ other._flip
 
     def pop(self, other: 'Transform'):
         """The inverse of push. Removes the effect of [other] from this transform.\n
         Faster version of [self] @= ~[other]."""
         self._flip         = self._flip ^ other._flip
-        self._rotation     = (self._rotation - flipRotation3D(other._rotation, self._flip) + 4) % 4
-        self._translation -= rotate3D(other._translation * flipToScale3D(self._flip), self._rotation)
+        self._rotation     = (self._rotation - _flipRotation(other._rotation, self._flip)) & 3
+        self._translation -= _rotationFlipMatrix(self._rotation, self._flip) * other._translation
 
     def inverted(self):
         """Equivalent to ~[self]."""
         flip = self._flip # Flip stays unchanged
-        rotation = flipRotation3D((-self._rotation + 4) % 4, flip)
+        rotation = _flipRotation((-self._rotation) & 3, flip)
         return Transform(
-            translation = - rotate3D(self._translation * flipToScale3D(flip), rotation),
+            translation = - (_rotationFlipMatrix(rotation, flip) * self._translation),
             rotation    = rotation,
             flip        = flip
         )
@@ -134,8 +190,8 @@ class Transform:
     def invert(self):
         """Faster version of [self] = ~[self]."""
         # Flip stays unchanged
-        self._rotation    = flipRotation3D((-self._rotation + 4) % 4, self._flip)
-        self._translation = - rotate3D(self._translation * flipToScale3D(self._flip), self._rotation)
+        self._rotation    = _flipRotation((-self._rotation) & 3, self._flip)
+        self._translation = - (_rotationFlipMatrix(self._rotation, self._flip) * self._translation)
 
     def __matmul__(self, other: 'Transform'):
         return self.compose(other)